@@ -0,0 +1,150 @@
+# 데이터/렌더 파이프라인 성능 회귀 벤치마크
+#   python -m bench run --scale small medium --output bench/results/base.json
+#   python -m bench compare bench/results/base.json bench/results/new.json
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from bench import synthetic
+from bench.cases import ROOT, make_cases
+
+
+def measure(func, repeat: int) -> dict:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    # tracemalloc 은 실행을 느리게 하므로 시간 측정과 분리해서 한 번 더 실행
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "time_min": min(times),
+        "time_median": statistics.median(times),
+        "peak_memory": peak,
+        "repeat": repeat,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return ""
+
+
+def run(args) -> int:
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "results": {},
+    }
+    for scale in args.scale:
+        print(f"[{scale}] {synthetic.SCALES[scale]}")
+        cases = make_cases(scale, llm_latency=args.llm_latency)
+        report["results"][scale] = {}
+        for name, func in cases.items():
+            if args.case and name not in args.case:
+                continue
+            result = measure(func, args.repeat)
+            report["results"][scale][name] = result
+            print(f"  {name:<20} {result['time_min'] * 1000:>10.2f} ms {result['peak_memory'] / 2**20:>10.2f} MiB")
+
+    output = Path(args.output or ROOT / "bench" / "results" / f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"saved: {output}")
+    return 0
+
+
+def compare(args) -> int:
+    base = json.loads(Path(args.base).read_text())
+    new = json.loads(Path(args.new).read_text())
+    print(f"base: {base.get('commit')} ({base.get('created_at')})  new: {new.get('commit')} ({new.get('created_at')})")
+    print(f"{'scale/case':<28}{'min time':>24}{'ratio':>8}{'peak memory':>26}{'ratio':>8}")
+
+    # 한쪽에만 있는 케이스는 비교되지 않으므로 따로 알림 (빠지거나 이름이 바뀐 케이스가 통과로 보이지 않도록)
+    base_keys = {(scale, name) for scale, cases in base["results"].items() for name in cases}
+    new_keys = {(scale, name) for scale, cases in new["results"].items() for name in cases}
+    missing_in_new = sorted(base_keys - new_keys)
+    missing_in_base = sorted(new_keys - base_keys)
+
+    regressions = 0
+    for scale, cases in new["results"].items():
+        for name, result in cases.items():
+            old = base["results"].get(scale, {}).get(name)
+            if old is None:
+                continue
+            # 짧은 케이스는 편차가 커서 최솟값 기준으로 비교
+            time_ratio = result["time_min"] / old["time_min"] if old["time_min"] else 1.0
+            mem_ratio = result["peak_memory"] / old["peak_memory"] if old["peak_memory"] else 1.0
+            flag = ""
+            if time_ratio > 1 + args.threshold or mem_ratio > 1 + args.threshold:
+                flag = "  <-- REGRESSION"
+                regressions += 1
+            print(
+                f"{scale + '/' + name:<28}"
+                f"{old['time_min'] * 1000:>10.2f} -> {result['time_min'] * 1000:>7.2f}ms"
+                f"{time_ratio:>8.2f}"
+                f"{old['peak_memory'] / 2**20:>10.2f} -> {result['peak_memory'] / 2**20:>7.2f}MiB"
+                f"{mem_ratio:>8.2f}{flag}"
+            )
+
+    for scale, name in missing_in_base:
+        print(f"{scale + '/' + name:<28}  only in new (no baseline)")
+    for scale, name in missing_in_new:
+        print(f"{scale + '/' + name:<28}  MISSING in new")
+
+    if regressions:
+        print(f"{regressions} case(s) regressed more than {args.threshold:.0%}")
+    if missing_in_new:
+        print(f"{len(missing_in_new)} baseline case(s) missing in new")
+    if regressions or missing_in_new:
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m bench")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="벤치마크 실행 후 결과를 JSON 으로 저장")
+    run_parser.add_argument("--scale", nargs="+", choices=list(synthetic.SCALES), default=["small", "medium"])
+    run_parser.add_argument("--case", nargs="+", help="특정 케이스만 실행")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--llm-latency", type=float, default=0.0, help="가짜 OpenAI 응답 지연(초)")
+    run_parser.add_argument("--output", help="결과 JSON 경로 (기본: bench/results/<시각>.json)")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = sub.add_parser("compare", help="두 결과 JSON 비교")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="회귀로 볼 증가율 (기본 10%%)")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
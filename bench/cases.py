@@ -0,0 +1,128 @@
+# 페이지 / review_data 함수를 Snowflake / AWS / OpenAI 없이 불러와 벤치마크 케이스로 구성
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from streamlit import logger as st_logger
+
+from bench import synthetic
+
+
+# streamlit 런타임 없이 페이지를 불러올 때 나오는 bare 모드 경고 숨김
+st_logger.set_log_level("error")
+
+
+ROOT = Path(__file__).resolve().parent.parent
+# 페이지와 같은 방식으로 루트 모듈(review_data, prefetch)을 import
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import review_data  # noqa: E402
+
+
+FAKE_SECRET = json.dumps({
+    "username": "bench",
+    "password": "bench",
+    "host": "bench.snowflakecomputing.com",
+    "warehouse": "bench",
+    "database": "bench",
+    "schema": "bench",
+    "openai-api-key": "bench",
+})
+
+
+class FakeCursor:
+    def __init__(self, columns, rows):
+        self.description = [(c, None, None, None, None, None, None) for c in columns]
+        self.rows = rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        pass
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+
+    def cursor(self):
+        return FakeCursor(self.columns, self.rows)
+
+
+class FakeOpenAI:
+    """summary() 가 부르는 chat.completions.create 만 흉내냄. latency 로 응답 지연을 줄 수 있음."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        time.sleep(self.latency)
+        message = SimpleNamespace(content="#소통이잘되는 #사이즈딱맞아요 #고퀄리티가성비")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def load_page(name: str):
+    """pages/review-{name}.py 를 외부 연결 없이 모듈로 불러옴. (__main__ 이 아니라 UI 는 실행되지 않음)"""
+    path = ROOT / "pages" / f"review-{name}.py"
+    spec = importlib.util.spec_from_file_location(f"bench_page_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch("boto3.Session"), \
+            mock.patch("awswrangler.secretsmanager.get_secret", return_value=FAKE_SECRET), \
+            mock.patch("snowflake.connector.connect"):
+        spec.loader.exec_module(module)
+    return module
+
+
+def make_cases(scale: str, llm_latency: float = 0.0) -> dict:
+    """케이스 이름 -> 인자 없는 함수. 입력 데이터 준비는 측정에서 제외."""
+    category = load_page("카테고리분류")
+    hashtag = load_page("해시태그생성")
+    hashtag.client = FakeOpenAI(latency=llm_latency)
+
+    data = synthetic.generate(scale)
+    conn = FakeConnection(synthetic.REVIEW_COLUMNS, data["review_rows"])
+
+    raw_df = review_data.run_query_df(conn, "")
+    review_df = review_data.parse_review_image_paths(raw_df.copy())
+    product_df = review_data.build_product_df(data["flash_df"], data["always_df"])
+
+    # 카테고리 페이지의 product_review 결과에는 리뷰 이미지 컬럼이 없음
+    category_df = review_df.drop(columns=["REVIEW_IMAGE_PATHS"])
+    review_sub_df = review_data.merge_reviews(category_df, product_df)
+
+    # 해시태그 페이지는 리뷰 이미지를 한 장씩(REVIEW_IMAGE_PATH) 받고, 가격은 정렬 키로만 씀
+    hashtag_df = review_df.assign(
+        REVIEW_IMAGE_PATH=review_df["REVIEW_IMAGE_PATHS"].str[0],
+        COST_PRICE=review_df["RATIO"] * 1000,
+    )
+
+    return {
+        "run_query_df": lambda: review_data.run_query_df(conn, ""),
+        "build_product_df": lambda: review_data.build_product_df(data["flash_df"], data["always_df"]),
+        "merge_reviews": lambda: review_data.merge_reviews(category_df, product_df),
+        # 포토후기 / 판매자비교 페이지: 리스트 값인 REVIEW_IMAGE_PATHS 컬럼을 그대로 병합
+        "merge_reviews_photo": lambda: review_data.merge_reviews(review_df, product_df),
+        "group_by_category": lambda: review_data.group_by_category(review_sub_df),
+        "prep_review": lambda: review_df["REVIEW"].map(category.prep_review),
+        # 포토후기 페이지: ARRAY 컬럼(JSON 문자열) 파싱 + URL 펼치기
+        "extract_photo_urls": lambda: review_data.extract_photo_urls(
+            review_data.parse_review_image_paths(raw_df.copy())
+        ),
+        "summary": lambda: hashtag.summary(
+            hashtag.build_user_message(hashtag_df, hashtag.DEFAULT_PROMPT)[1]
+        ),
+    }
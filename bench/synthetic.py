@@ -0,0 +1,108 @@
+# 벤치마크용 합성 데이터 생성 (Snowflake 쿼리 결과와 같은 컬럼 구성)
+import json
+import random
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+
+# 판매자당 리뷰 수 / 카탈로그(상시상품) 크기
+SCALES = {
+    "small": {"reviews": 200, "catalog": 5_000},
+    "medium": {"reviews": 2_000, "catalog": 50_000},
+    "large": {"reviews": 20_000, "catalog": 300_000},
+}
+
+THUMB = "https://thumb-ssl.grip.show"
+
+WORDS = [
+    "배송", "빨라요", "사이즈", "딱", "맞아요", "재구매", "의사", "있어요", "색감이", "예뻐요",
+    "가성비", "최고", "소통이", "잘돼요", "포장", "꼼꼼해요", "!!", "ㅎㅎ", "^^", "\n",
+]
+
+CATEGORIES = [
+    "패션", "뷰티", "식품", "리빙", "잡화", "키즈", "스포츠", "가전", "반려동물", "주얼리",
+    "원피스", "니트", "스킨케어", "과일", "주방", "가방", "신발", "유아동복", "캠핑", "귀걸이",
+]
+
+# review_data.product_reviews 결과 컬럼 (포토후기 / 판매자비교 페이지)
+REVIEW_COLUMNS = [
+    "SELLER_SEQ", "SELLER_NAME", "PRODUCT_SEQ", "PRODUCT_ID", "PRODUCT_NAME", "FLASH",
+    "USER_SEQ", "USER_NAME", "REVIEW_SEQ", "REVIEW", "RATIO", "REVIEW_LENGTH", "CREATED_AT_REVIEW",
+    "SELLER_COMMENT", "IMAGE_PATH", "REVIEW_IMAGE_PATHS",
+]
+
+
+def review_text(rng: random.Random) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(5, 60)))
+
+
+def always_df(rng: random.Random, catalog: int) -> pd.DataFrame:
+    # 상시상품은 상품당 1~3개 카테고리 행으로 내려옴
+    rows = []
+    for i in range(catalog):
+        for category_seq in rng.sample(range(len(CATEGORIES)), rng.randint(1, 3)):
+            rows.append({
+                "PRODUCT_SEQ": i,
+                "PRODUCT_ID": f"A{i}",
+                "PRODUCT_NAME": f"상시상품 {i}",
+                "CATEGORY_SEQ": category_seq,
+                "CATEGORY_NAME": CATEGORIES[category_seq],
+                "COST_PRICE": rng.randint(1, 100) * 1000,
+                "IMAGE_PATH": f"{THUMB}/product/A{i}.jpg?type=w&w=500",
+            })
+    return pd.DataFrame(rows)
+
+
+def flash_df(rng: random.Random, catalog: int) -> pd.DataFrame:
+    # 플래시상품은 상시상품의 1/5 규모, LLM 이 분류한 lv2~lv4 카테고리를 가짐
+    rows = []
+    for i in range(catalog // 5):
+        lv2, lv3, lv4 = rng.sample(CATEGORIES, 3)
+        rows.append({
+            "LIVE_ID": f"L{i // 10}",
+            "TITLE": f"라이브 {i // 10}",
+            "USER_SEQ": i % 500,
+            "USER_NAME": f"판매자{i % 500}",
+            "REQUEST_AT": datetime(2026, 1, 1) + timedelta(minutes=i),
+            "PRODUCT_NAME": f"플래시상품 {i}",
+            "LV2_CATEGORY_NAME": lv2,
+            "LV3_CATEGORY_NAME": lv3,
+            "LV4_CATEGORY_NAME": lv4 if rng.random() < 0.7 else None,
+            "TAGS": "",
+            "DESCRIPTION": "",
+            "PRODUCT_ID": f"F{i}",
+            "IMAGE_PATH": f"{THUMB}/product/F{i}.jpg?type=w&w=500",
+            "COST_PRICE": rng.randint(1, 100) * 1000,
+        })
+    return pd.DataFrame(rows)
+
+
+def review_rows(rng: random.Random, reviews: int, catalog: int) -> list:
+    """product_review 쿼리가 커서에서 돌려주는 형태의 튜플 목록. 이미지 배열은 JSON 문자열 또는 NULL."""
+    rows = []
+    for i in range(reviews):
+        if rng.random() < 0.5:
+            product_id = f"A{rng.randrange(catalog)}"
+        else:
+            product_id = f"F{rng.randrange(max(catalog // 5, 1))}"
+        text = review_text(rng)
+        # 포토후기가 없는 리뷰는 이미지 배열이 NULL 로 내려옴
+        images = [f"{THUMB}/review/{i}_{n}.jpg?type=w&w=150" for n in range(rng.randint(0, 5))]
+        rows.append((
+            1, "벤치판매자", i % 300, product_id, f"상품 {product_id}", "N",
+            10_000 + i, f"구매자{i}", i, text, rng.randint(1, 5), len(text),
+            datetime(2026, 1, 1) + timedelta(hours=i), None,
+            f"{THUMB}/product/{product_id}.jpg?type=w&w=150", json.dumps(images) if images else None,
+        ))
+    return rows
+
+
+def generate(scale: str, seed: int = 0) -> dict:
+    params = SCALES[scale]
+    rng = random.Random(seed)
+    return {
+        "review_rows": review_rows(rng, params["reviews"], params["catalog"]),
+        "flash_df": flash_df(rng, params["catalog"]),
+        "always_df": always_df(rng, params["catalog"]),
+    }
@@ -1,4 +1,9 @@
 import streamlit as st
 
+from prefetch import get_prefetcher
+
+# 앱 시작 시 백그라운드 스케줄러를 띄우고 카탈로그 캐시를 미리 채움
+get_prefetcher()
+
 st.title("AI Prototype Studio")
 st.write("여기서 프로젝트의 메인 안내 또는 대시보드를 보여줄 수 있습니다.")
\ No newline at end of file
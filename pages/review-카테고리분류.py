@@ -1,32 +1,15 @@
-import snowflake.connector
 import streamlit as st
 import pandas as pd
-import awswrangler as wr
-import boto3
 import json
 import re
 
-
-session = boto3.Session(profile_name="prod-ai-data-team")
-secret = json.loads(wr.secretsmanager.get_secret("prod/db/snowflake", boto3_session=session))
-conn = snowflake.connector.connect(
-    user=secret["username"],
-    password=secret["password"],
-    account=re.sub(".snowflakecomputing.com", "", secret["host"]),
-    warehouse=secret["warehouse"],
-    database=secret["database"],
-    schema=secret["schema"]
+from prefetch import get_prefetcher, record_lookup, track_load
+from review_data import (
+    get_conn, run_query_df, flash_product_info, always_product_info,
+    build_product_df, merge_reviews, group_by_category,
 )
 
 
-def run_query_df(conn, sql: str) -> pd.DataFrame:
-    with conn.cursor() as cur:
-        cur.execute(sql)
-        cols = [desc[0] for desc in cur.description]  # 컬럼 이름 추출
-        rows = cur.fetchall()
-        return pd.DataFrame(rows, columns=cols)
-
-
 def parse_json_safely(text: str) -> dict:
     """모델 응답에서 JSON만 뽑아 안전하게 dict로 변환."""
     # 1) 우선 그대로 시도
@@ -37,6 +20,7 @@ def parse_json_safely(text: str) -> dict:
 
 
 @st.cache_data(ttl=86400)  # 24시간 = 60*60*24초
+@track_load("카테고리분류.product_review")
 def product_review(seller_name: str) -> str:
     sql = f"""
         WITH t1 AS (
@@ -85,81 +69,11 @@ def product_review(seller_name: str) -> str:
         FROM t1
             LEFT JOIN grip_db_realtime.member m ON m.user_seq = t1.user_seq
     """
-    df = run_query_df(conn, sql)
+    df = run_query_df(get_conn(), sql)
     df = df.drop_duplicates(['PRODUCT_SEQ', 'REVIEW'])
     df = df.sort_values(['REVIEW_LENGTH'], ascending=False)
     return df
 
-@st.cache_data(ttl=86400)  # 24시간 = 60*60*24초
-def flash_product_info():
-    sql = """
-          select fpi.live_id                live_id, \
-                 c.title                    title, \
-                 m.user_seq                 user_seq, \
-                 m.user_name                user_name, \
-                 fpi.request_at             request_at, \
-                 fpi.product_name           product_name, \
-                 fpi.lv2_category_name      lv2_category_name, \
-                 fpi.lv3_category_name      lv3_category_name, \
-                 fpi.lv4_category_name      lv4_category_name, \
-                 fpi.tags                   tags, \
-                 fpi.description            description, \
-                 fpi.product_id             product_id, \
-                 CONCAT('https://thumb-ssl.grip.show', \
-                        (case when length(ppi.image_path) > 0 then ppi.image_path else pppi.image_path end), \
-                        '?type=w&w=500') AS image_path, \
-                 pi.cost_price              cost_price
-          from aibigdata_db.flash_product_info fpi
-
-                   left join grip_db_realtime.product_info pi on pi.product_id = fpi.product_id
-                   left join grip_db_realtime.product_preview_image ppi ON ppi.product_seq = pi.product_seq
-                   left join grip_db_realtime.product_preview_image pppi \
-                             ON (pppi.image_seq = 1 and pppi.product_seq = pi.product_seq)
-                   left join grip_db_realtime.content c on c.content_id = fpi.live_id
-                   left join grip_db_realtime.member m on m.user_seq = c.user_seq
-
-          where fpi.product_id is not null
-            -- and pi.deleted = 'N'
-            -- and pi.excluded = 'N'
-            and pi.cost_price > 0 \
-          """
-    df = run_query_df(conn, sql)
-    return df
-
-
-@st.cache_data(ttl=86400)  # 24시간 = 60*60*24초
-def always_product_info():
-    sql = """
-          SELECT pi.product_seq  AS product_seq, \
-                 pi.product_id   AS product_id, \
-                 pi.product_name AS product_name, \
-                 pc.category_seq AS category_seq, \
-                 c.category_name AS category_name, \
-                 pi.cost_price      cost_price, \
-                 CONCAT('https://thumb-ssl.grip.show', \
-                        (CASE \
-                             WHEN length(ppi.image_path) > 0 THEN ppi.image_path \
-                             ELSE pppi.image_path \
-                            END), \
-                        '?type=w&w=500' \
-                 )               AS image_path
-          FROM grip_db_realtime.product_info pi
-                   LEFT JOIN grip_db_realtime.product_preview_image ppi ON ppi.product_seq = pi.product_seq
-                   LEFT JOIN grip_db.product_preview_image pppi \
-                             ON (pppi.image_seq = 1 AND pppi.product_seq = pi.product_seq)
-                   LEFT JOIN grip_db.product_category pc ON pi.product_seq = pc.product_seq
-                   LEFT JOIN grip_db.category c ON c.category_seq = pc.category_seq
-          WHERE pi.flash = 'N'
-            AND pi.deleted = 'N'
-            AND pi.excluded = 'N'
-            AND pi.cost_price > 0
-            AND pi.created_at >= DATEADD(YEAR, -1, CURRENT_TIMESTAMP) \
-
-          """
-    df = run_query_df(conn, sql)
-    return df
-
-
 def prep_review(words):
     words = words.replace("\n", " ")
     words = re.sub(r"[^a-zA-Z가-힣0-9\s]", " ", words)  # 특수 기호 제거
@@ -169,6 +83,7 @@ def prep_review(words):
 
 st.set_page_config(layout="wide")
 if __name__ == "__main__":
+    get_prefetcher()  # 스케줄러 시작 (처음 한 번 카탈로그 warm)
     st.title("🧾 리뷰 카테고리 분류")
 
 
@@ -176,76 +91,18 @@ if __name__ == "__main__":
     if seller_name:
 
         review_df = product_review(seller_name)
+        record_lookup("카테고리분류.product_review", product_review, seller_name)
         flash_df = flash_product_info()
         always_df = always_product_info()
         # st.dataframe(review_df.head(1))
         # st.dataframe(flash_df.head(1))
         # st.dataframe(always_df.head(1))
 
-        flash_sub_df = flash_df[[
-            "PRODUCT_NAME", "LV2_CATEGORY_NAME", "LV3_CATEGORY_NAME", "LV4_CATEGORY_NAME",
-            "PRODUCT_ID", "COST_PRICE"
-        ]]
-        flash_sub_df = flash_sub_df.rename(columns={"PRODUCT_NAME": "LLM_PRODUCT_NAME"})
-        flash_sub_df = flash_sub_df.fillna("").drop_duplicates(["PRODUCT_ID"])
-
-        always_sub_df = always_df.drop_duplicates(["PRODUCT_ID", "CATEGORY_SEQ"])
-        always_sub_df = always_sub_df.groupby("PRODUCT_ID")["CATEGORY_NAME"].apply(list).reset_index(
-            name="CATEGORY_LIST")
-
-        product_df = pd.merge(always_sub_df, flash_sub_df, how="outer")
-
-        review_sub_df = pd.merge(review_df, product_df, on="PRODUCT_ID", how="left")
-        review_sub_df = review_sub_df.fillna("")
-
-        review_category_dict = {}
-
-        for _, row in review_sub_df.iterrows():
-            CATEGORY_LIST = row["CATEGORY_LIST"]
-            PRODUCT_NAME = row["PRODUCT_NAME"]
-            LLM_PRODUCT_NAME = row["PRODUCT_NAME"]
-            LV2_CATEGORY_NAME = row["LV2_CATEGORY_NAME"]
-            LV3_CATEGORY_NAME = row["LV3_CATEGORY_NAME"]
-            LV4_CATEGORY_NAME = row["LV4_CATEGORY_NAME"]
-            COST_PRICE = row["COST_PRICE"]
-            IMAGE_PATH = row["IMAGE_PATH"]
-            REVIEW = row["REVIEW"]
-            RATIO = row["RATIO"]
-            USER_NAME = row["USER_NAME"]
+        product_df = build_product_df(flash_df, always_df)
 
-            if IMAGE_PATH:
-                pass
-            else:
-                continue
+        review_sub_df = merge_reviews(review_df, product_df)
 
-            if CATEGORY_LIST:
-                for category in CATEGORY_LIST:
-                    if category not in review_category_dict:
-                        review_category_dict[category] = []
-                    review_category_dict[category].append({
-                        "PRODUCT_NAME": PRODUCT_NAME,
-                        "USER_NAME": USER_NAME,
-                        "REVIEW": REVIEW,
-                        "COST_PRICE": COST_PRICE,
-                        "RATIO": RATIO,
-                        "IMAGE_PATH": IMAGE_PATH,
-                        "상품": "상시상품"
-                    })
-                continue
-            elif LV2_CATEGORY_NAME:
-                for category in [LV2_CATEGORY_NAME, LV3_CATEGORY_NAME, LV4_CATEGORY_NAME]:
-                    if category:
-                        if category not in review_category_dict:
-                            review_category_dict[category] = []
-                        review_category_dict[category].append({
-                            "LLM_PRODUCT_NAME": LLM_PRODUCT_NAME,
-                            "USER_NAME": USER_NAME,
-                            "REVIEW": REVIEW,
-                            "COST_PRICE": COST_PRICE,
-                            "RATIO": RATIO,
-                            "IMAGE_PATH": IMAGE_PATH,
-                            "상품": "플래시상품"
-                        })
+        review_category_dict = group_by_category(review_sub_df)
 
         # 탭 생성 (카테고리별)
         tabs = st.tabs(list(review_category_dict.keys()))
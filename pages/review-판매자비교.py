@@ -0,0 +1,82 @@
+import streamlit as st
+
+from prefetch import get_prefetcher, record_lookup
+from review_data import (
+    product_reviews, flash_product_info, always_product_info,
+    build_product_df, merge_reviews, group_by_category, extract_photo_urls,
+)
+
+
+st.set_page_config(layout="wide")
+if __name__ == "__main__":
+    get_prefetcher()  # 스케줄러 시작 (처음 한 번 카탈로그 warm)
+    st.title("🧾 판매자 리뷰 비교")
+    st.markdown("""
+    - 여러 판매자 이름을 쉼표(,)로 구분해 입력하면 한 번의 조회로 나란히 비교합니다.
+    - 최근 6개월 이내 작성된 리뷰만 조회합니다.
+    """)
+
+    names_text = st.text_input("판매자 이름을 쉼표로 구분해 입력해주세요.", placeholder="예: 제제시스터, 판매자2")
+    view = st.radio("보기", ["카테고리", "포토후기"], horizontal=True)
+
+    # 입력 순서는 유지하면서 공백/중복 제거
+    seller_names = list(dict.fromkeys(name.strip() for name in names_text.split(",") if name.strip()))
+    if seller_names:
+
+        # 캐시 키가 입력 순서에 따라 달라지지 않도록 정렬해서 조회
+        seller_key = tuple(sorted(seller_names))
+        review_df = product_reviews(seller_key)
+        record_lookup("product_reviews", product_reviews, seller_key)
+        flash_df = flash_product_info()
+        always_df = always_product_info()
+
+        product_df = build_product_df(flash_df, always_df)
+
+        # 병합은 전체 판매자에 대해 한 번만 하고 판매자별로 나눔
+        review_sub_df = merge_reviews(review_df, product_df)
+        seller_dfs = dict(tuple(review_sub_df.groupby("SELLER_NAME", sort=False)))
+
+        missing = [name for name in seller_names if name not in seller_dfs]
+        if missing:
+            st.warning(f"리뷰가 없는 판매자: {', '.join(missing)}")
+
+        if view == "카테고리":
+            seller_category_dict = {
+                name: group_by_category(seller_dfs[name]) if name in seller_dfs else {}
+                for name in seller_names
+            }
+            # 판매자 전체 리뷰 수가 많은 카테고리부터 탭 생성
+            category_counts = {}
+            for review_category_dict in seller_category_dict.values():
+                for category, records in review_category_dict.items():
+                    category_counts[category] = category_counts.get(category, 0) + len(records)
+            categories = sorted(category_counts, key=category_counts.get, reverse=True)
+
+            if not categories:
+                st.info("표시할 리뷰가 없습니다.")
+            else:
+                tabs = st.tabs(categories)
+                for tab, category in zip(tabs, categories):
+                    with tab:
+                        st.subheader(f"📦 {category}")
+                        cols = st.columns(len(seller_names))
+                        for col, name in zip(cols, seller_names):
+                            with col:
+                                records = seller_category_dict[name].get(category, [])
+                                st.markdown(f"#### {name} ({len(records)}건)")
+                                for row in records:
+                                    st.image(row["IMAGE_PATH"], width=120)
+                                    st.markdown(f"**상품명**: {row.get('PRODUCT_NAME', row.get('LLM_PRODUCT_NAME', ''))}")
+                                    st.markdown(f"**리뷰**: {row['REVIEW']}")
+                                    st.markdown(f"**평점**: ⭐ {row['RATIO']}")
+                                    st.markdown("---")
+        else:
+            cols = st.columns(len(seller_names))
+            for col, name in zip(cols, seller_names):
+                with col:
+                    urls = extract_photo_urls(seller_dfs[name]) if name in seller_dfs else []
+                    st.markdown(f"#### {name} ({len(urls)}장)")
+                    if urls:
+                        st.image(urls, width=150)
+                    else:
+                        st.info("표시할 이미지가 없습니다.")
@@ -1,4 +1,3 @@
-import snowflake.connector
 import streamlit as st
 import pandas as pd
 from openai import OpenAI
@@ -7,30 +6,15 @@ import boto3
 import json
 import re
 
+from prefetch import get_prefetcher, record_lookup, track_load
+from review_data import get_conn, run_query_df
 
-session = boto3.Session(profile_name="prod-ai-data-team")
-secret = json.loads(wr.secretsmanager.get_secret("prod/db/snowflake", boto3_session=session))
-conn = snowflake.connector.connect(
-    user=secret["username"],
-    password=secret["password"],
-    account=re.sub(".snowflakecomputing.com", "", secret["host"]),
-    warehouse=secret["warehouse"],
-    database=secret["database"],
-    schema=secret["schema"]
-)
 
+session = boto3.Session(profile_name="prod-ai-data-team")
 secret_llm = json.loads(wr.secretsmanager.get_secret("prod/external-api-keys", boto3_session=session))
 client = OpenAI(api_key=secret_llm.get("openai-api-key"))
 
 
-def run_query_df(conn, sql: str) -> pd.DataFrame:
-    with conn.cursor() as cur:
-        cur.execute(sql)
-        cols = [desc[0] for desc in cur.description]  # 컬럼 이름 추출
-        rows = cur.fetchall()
-        return pd.DataFrame(rows, columns=cols)
-
-
 def parse_json_safely(text: str) -> dict:
     """모델 응답에서 JSON만 뽑아 안전하게 dict로 변환."""
     # 1) 우선 그대로 시도
@@ -58,6 +42,7 @@ def summary(user_message):
 
 
 @st.cache_data(ttl=86400)  # 24시간 = 60*60*24초
+@track_load("해시태그생성.product_review")
 def product_review(seller_name: str) -> str:
     sql = f"""
         WITH t1 AS (
@@ -120,7 +105,7 @@ def product_review(seller_name: str) -> str:
             LEFT JOIN grip_db_realtime.member m ON m.user_seq = t1.user_seq
             LEFT JOIN t2 ON t2.relation_seq = t1.review_seq
     """
-    df = run_query_df(conn, sql)
+    df = run_query_df(get_conn(), sql)
     df = df.drop_duplicates(['PRODUCT_SEQ', 'REVIEW'])
     df = df.sort_values(['REVIEW_LENGTH'], ascending=False)
     return df
@@ -152,11 +137,29 @@ DEFAULT_PROMPT = """
 """
 
 
+def build_user_message(review_df: pd.DataFrame, user_prompt: str):
+    # 샘플링(정렬 기준은 기존 로직 유지)
+    sample_df = review_df.sort_values(
+        ["REVIEW_IMAGE_PATH", "REVIEW_LENGTH", "CREATED_AT_REVIEW", "COST_PRICE"],
+        ascending=[False, False, False, False]
+    ).head(10)
+
+    # 모델에 전달할 리뷰 딕셔너리
+    reviews = {f"{i}번째고객": text for i, text in enumerate(sample_df["REVIEW"], start=1)}
 
+    # 프롬프트 구성
+    # 사용자가 {reviews} 토큰을 빼먹었을 경우를 대비한 안전장치
+    final_prompt = (
+        user_prompt if "{reviews}" in user_prompt
+        else user_prompt + "\n\n<리뷰>\n{reviews}\n</리뷰>\n"
+    )
+    user_message = final_prompt.format(reviews=reviews)
+    return sample_df, user_message
 
 
 st.set_page_config(layout="wide")
 if __name__ == "__main__":
+    get_prefetcher()  # 스케줄러 시작 (처음 한 번 카탈로그 warm)
     st.title("🧾 리뷰 해시태그 생성")
 
     # 1) 입력부
@@ -173,27 +176,13 @@ if __name__ == "__main__":
     if run and seller_name:
         with st.spinner("리뷰를 불러오고 해시태그를 생성 중..."):
             review_df = product_review(seller_name)
+            record_lookup("해시태그생성.product_review", product_review, seller_name)
 
             if review_df is None or review_df.empty:
                 st.warning("해당 판매자의 리뷰가 없습니다.")
                 st.stop()
 
-            # 샘플링(정렬 기준은 기존 로직 유지)
-            sample_df = review_df.sort_values(
-                ["REVIEW_IMAGE_PATH", "REVIEW_LENGTH", "CREATED_AT_REVIEW", "COST_PRICE"],
-                ascending=[False, False, False, False]
-            ).head(10)
-
-            # 모델에 전달할 리뷰 딕셔너리
-            reviews = {f"{i}번째고객": text for i, text in enumerate(sample_df["REVIEW"], start=1)}
-
-            # 3) 프롬프트 구성
-            # 사용자가 {reviews} 토큰을 빼먹었을 경우를 대비한 안전장치
-            final_prompt = (
-                user_prompt if "{reviews}" in user_prompt
-                else user_prompt + "\n\n<리뷰>\n{reviews}\n</리뷰>\n"
-            )
-            user_message = final_prompt.format(reviews=reviews)
+            sample_df, user_message = build_user_message(review_df, user_prompt)
 
             # 4) LLM 호출
             st.markdown("### 💫 해시태그 추출")
@@ -0,0 +1,201 @@
+# 인기 판매자 캐시를 백그라운드에서 미리 갱신하는 스케줄러
+import functools
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL = 86400  # 페이지의 st.cache_data ttl 과 동일 (24시간)
+
+# 환경변수로 조정 가능한 설정값
+PREFETCH_TOP_N = int(os.environ.get("PREFETCH_TOP_N", 20))  # 갱신 대상 상위 판매자 수
+PREFETCH_INTERVAL = int(os.environ.get("PREFETCH_INTERVAL", 60))  # 스케줄러 점검 주기(초)
+PREFETCH_MAX_WORKERS = int(os.environ.get("PREFETCH_MAX_WORKERS", 2))  # 동시 쿼리 수
+PREFETCH_CREDIT_BUDGET = float(os.environ.get("PREFETCH_CREDIT_BUDGET", 2.0))  # 하루 크레딧 한도
+PREFETCH_CREDITS_PER_HOUR = float(os.environ.get("PREFETCH_CREDITS_PER_HOUR", 1.0))  # X-Small = 1
+PREFETCH_DEFAULT_SECONDS = float(os.environ.get("PREFETCH_DEFAULT_SECONDS", 60))  # 처음 갱신하는 항목의 예상 쿼리 시간
+PREFETCH_DECAY_INTERVAL = int(os.environ.get("PREFETCH_DECAY_INTERVAL", 86400))  # 조회 횟수를 절반으로 줄이는 주기
+PREFETCH_MAX_BACKOFF = int(os.environ.get("PREFETCH_MAX_BACKOFF", 3600))  # 실패 시 재시도 최대 대기(초)
+
+# (name, args) -> 캐시 함수 본문이 실제로 실행되어 캐시가 채워진 시각
+load_times = {}
+load_times_lock = threading.Lock()
+
+
+def track_load(name: str):
+    """st.cache_data 바로 아래에 붙여, 캐시 함수 본문이 실제로 실행된 시각을 기록.
+
+    캐시 적중 시에는 본문이 실행되지 않으므로 기록된 시각이 곧 캐시 항목이 쓰인 시각이다.
+    name 은 Prefetcher.record / warm 에 넘기는 이름과 같아야 한다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            result = func(*args)
+            with load_times_lock:
+                load_times[(name, args)] = time.time()
+            return result
+        return wrapper
+    return decorator
+
+
+class Prefetcher:
+    """자주 조회되는 캐시 항목이 만료되면 사용자보다 먼저 백그라운드에서 다시 채움.
+
+    st.cache_data 항목은 원자적으로 교체할 수 없어서, 만료 전에 clear 하지 않고
+    만료된 직후(점검 주기 이내)에 다시 불러온다. 갱신이 실패해도 기존 캐시는 건드리지 않는다.
+    loader 는 track_load 로 감싼 캐시 함수여야 하고, 조회 시점에 get_conn() 으로 연결을 가져와야 한다.
+    """
+
+    def __init__(self, top_n=PREFETCH_TOP_N, interval=PREFETCH_INTERVAL, max_workers=PREFETCH_MAX_WORKERS,
+                 credit_budget=PREFETCH_CREDIT_BUDGET, credits_per_hour=PREFETCH_CREDITS_PER_HOUR,
+                 default_seconds=PREFETCH_DEFAULT_SECONDS, decay_interval=PREFETCH_DECAY_INTERVAL,
+                 max_backoff=PREFETCH_MAX_BACKOFF):
+        self.top_n = top_n
+        self.interval = interval
+        self.credit_budget = credit_budget
+        self.credits_per_hour = credits_per_hour
+        self.default_seconds = default_seconds
+        self.decay_interval = decay_interval
+        self.max_backoff = max_backoff
+
+        self.lock = threading.Lock()
+        self.hits = Counter()  # key -> 조회 횟수 (decay_interval 마다 절반으로 감소)
+        self.entries = {}  # key -> {"loader", "args", "pinned", "seconds", "failures", "retry_at"}
+        self.running = set()
+        self.credits_used = 0.0  # 실행 중인 갱신의 예상 비용 포함
+        self.budget_day = time.strftime("%Y-%m-%d")
+        self.decayed_at = time.time()
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        threading.Thread(target=self._loop, name="prefetch-scheduler", daemon=True).start()
+
+    def record(self, name: str, loader, *args):
+        """사용자가 조회한 항목을 기록. 조회가 많은 상위 top_n 항목이 갱신 대상이 된다."""
+        key = (name, args)
+        with self.lock:
+            self.hits[key] += 1
+            entry = self.entries.setdefault(key, self._new_entry(args, pinned=False))
+            entry["loader"] = loader
+
+    def warm(self, name: str, loader):
+        """인자 없는 카탈로그 로더를 즉시 백그라운드에서 채우고, 이후에도 계속 갱신 대상으로 유지."""
+        key = (name, ())
+        with self.lock:
+            if key in self.entries:
+                self.entries[key]["loader"] = loader
+                return
+            entry = self._new_entry((), pinned=True)
+            entry["loader"] = loader
+            self.entries[key] = entry
+        self.run_pending()
+
+    def run_pending(self):
+        now = time.time()
+        with self.lock:
+            today = time.strftime("%Y-%m-%d")
+            if today != self.budget_day:
+                self.budget_day = today
+                self.credits_used = 0.0
+            self._decay(now)
+            with load_times_lock:
+                # 만료된 항목의 적재 시각은 더 이상 필요 없음 (없으면 만료된 것으로 본다)
+                for key in [key for key, loaded_at in load_times.items() if now - loaded_at >= CACHE_TTL]:
+                    del load_times[key]
+                fresh = set(load_times)
+
+            top = [key for key, _ in self.hits.most_common(self.top_n)]
+            # 상위 top_n 에서 밀려난 항목은 더 이상 갱신하지 않으므로 정리
+            for key in list(self.entries):
+                if not self.entries[key]["pinned"] and key not in top and key not in self.running:
+                    del self.entries[key]
+
+            candidates = [key for key, entry in self.entries.items() if entry["pinned"]]
+            candidates += [key for key in top if key in self.entries]
+
+            for key in candidates:
+                entry = self.entries[key]
+                if key in self.running or now < entry["retry_at"] or key in fresh:
+                    continue
+                # 실행 전에 예상 비용을 예약해야 한 번의 점검에서 예산을 넘겨 제출하지 않음
+                cost = (entry["seconds"] or self.default_seconds) / 3600 * self.credits_per_hour
+                if self.credits_used + cost > self.credit_budget:
+                    continue
+                self.credits_used += cost
+                self.running.add(key)
+                self.executor.submit(self._refresh, key, entry["loader"], entry["args"], cost)
+
+    def _new_entry(self, args, pinned):
+        return {"args": args, "pinned": pinned, "seconds": None, "failures": 0, "retry_at": 0}
+
+    def _decay(self, now):
+        # 오래된 조회의 비중을 줄여 최근 인기 판매자를 우선하고, 1 미만으로 떨어진 키는 제거
+        if now - self.decayed_at < self.decay_interval:
+            return
+        self.decayed_at = now
+        for key in list(self.hits):
+            self.hits[key] /= 2
+            if self.hits[key] < 1:
+                del self.hits[key]
+
+    def _refresh(self, key, loader, args, reserved):
+        start = time.time()
+        try:
+            loader(*args)  # 만료된 항목이므로 새로 조회되어 캐시에 채워짐 (적재 시각은 track_load 가 기록)
+            loaded = True
+        except Exception:
+            logger.exception("prefetch refresh failed: %s", key)
+            loaded = False
+        elapsed = time.time() - start
+        with self.lock:
+            # 예약했던 예상 비용을 실제 비용으로 정산
+            self.credits_used = max(self.credits_used - reserved + elapsed / 3600 * self.credits_per_hour, 0.0)
+            self.running.discard(key)
+            entry = self.entries.get(key)
+            if entry is None:
+                return
+            entry["seconds"] = elapsed
+            if loaded:
+                entry["failures"] = 0
+                entry["retry_at"] = 0
+            else:
+                # 같은 실패를 점검 주기마다 반복하지 않도록 지수적으로 대기
+                entry["failures"] += 1
+                entry["retry_at"] = time.time() + min(self.interval * 2 ** entry["failures"], self.max_backoff)
+
+    def _loop(self):
+        while True:
+            time.sleep(self.interval)
+            self.run_pending()
+
+
+def record_lookup(name: str, loader, *args):
+    """세션의 조회 입력이 바뀐 경우에만 Prefetcher.record 로 기록.
+
+    Streamlit 은 위젯을 조작할 때마다 페이지를 다시 실행하므로, 매 실행마다 기록하면
+    조회 횟수가 아니라 rerun 횟수가 쌓인다.
+    """
+    state_key = f"prefetch.last_lookup.{name}"
+    if st.session_state.get(state_key) == args:
+        return
+    st.session_state[state_key] = args
+    get_prefetcher().record(name, loader, *args)
+
+
+@st.cache_resource
+def get_prefetcher() -> Prefetcher:
+    # 프로세스 전체에서 하나의 스케줄러만 사용.
+    # 카탈로그는 판매자와 무관하므로 스케줄러를 만들 때 바로 백그라운드에서 채움
+    from review_data import flash_product_info, always_product_info  # review_data 가 prefetch 를 import 하므로 지연 import
+
+    prefetcher = Prefetcher()
+    prefetcher.warm("flash_product_info", flash_product_info)
+    prefetcher.warm("always_product_info", always_product_info)
+    return prefetcher
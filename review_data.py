@@ -0,0 +1,283 @@
+# 리뷰 페이지 공통 데이터 접근 (Snowflake 연결, 카탈로그 로더, 공통 변환)
+import snowflake.connector
+import streamlit as st
+import pandas as pd
+import awswrangler as wr
+import boto3
+import json
+import re
+
+from prefetch import track_load
+
+
+@st.cache_resource(validate=lambda conn: not conn.is_closed())
+def get_conn():
+    """프로세스 전체에서 공유하는 Snowflake 연결. 닫힌 연결이면 새로 만든다.
+
+    페이지 스크립트의 모듈 변수 대신 조회 시점마다 이 함수로 연결을 가져와야
+    백그라운드 prefetch 가 오래된 세션을 붙잡지 않는다.
+    """
+    session = boto3.Session(profile_name="prod-ai-data-team")
+    secret = json.loads(wr.secretsmanager.get_secret("prod/db/snowflake", boto3_session=session))
+    return snowflake.connector.connect(
+        user=secret["username"],
+        password=secret["password"],
+        account=re.sub(".snowflakecomputing.com", "", secret["host"]),
+        warehouse=secret["warehouse"],
+        database=secret["database"],
+        schema=secret["schema"],
+        client_session_keep_alive=True,  # 쿼리가 뜸한 시간에도 세션 만료 방지
+    )
+
+
+def run_query_df(conn, sql: str, params=None) -> pd.DataFrame:
+    with conn.cursor() as cur:
+        cur.execute(sql, params)  # params 는 %s 자리에 바인딩 (커넥터가 이스케이프)
+        cols = [desc[0] for desc in cur.description]  # 컬럼 이름 추출
+        rows = cur.fetchall()
+        return pd.DataFrame(rows, columns=cols)
+
+
+@st.cache_data(ttl=86400)  # 24시간 = 60*60*24초
+@track_load("flash_product_info")
+def flash_product_info():
+    sql = """
+          select fpi.live_id                live_id, \
+                 c.title                    title, \
+                 m.user_seq                 user_seq, \
+                 m.user_name                user_name, \
+                 fpi.request_at             request_at, \
+                 fpi.product_name           product_name, \
+                 fpi.lv2_category_name      lv2_category_name, \
+                 fpi.lv3_category_name      lv3_category_name, \
+                 fpi.lv4_category_name      lv4_category_name, \
+                 fpi.tags                   tags, \
+                 fpi.description            description, \
+                 fpi.product_id             product_id, \
+                 CONCAT('https://thumb-ssl.grip.show', \
+                        (case when length(ppi.image_path) > 0 then ppi.image_path else pppi.image_path end), \
+                        '?type=w&w=500') AS image_path, \
+                 pi.cost_price              cost_price
+          from aibigdata_db.flash_product_info fpi
+
+                   left join grip_db_realtime.product_info pi on pi.product_id = fpi.product_id
+                   left join grip_db_realtime.product_preview_image ppi ON ppi.product_seq = pi.product_seq
+                   left join grip_db_realtime.product_preview_image pppi \
+                             ON (pppi.image_seq = 1 and pppi.product_seq = pi.product_seq)
+                   left join grip_db_realtime.content c on c.content_id = fpi.live_id
+                   left join grip_db_realtime.member m on m.user_seq = c.user_seq
+
+          where fpi.product_id is not null
+            -- and pi.deleted = 'N'
+            -- and pi.excluded = 'N'
+            and pi.cost_price > 0 \
+          """
+    df = run_query_df(get_conn(), sql)
+    return df
+
+
+@st.cache_data(ttl=86400)  # 24시간 = 60*60*24초
+@track_load("always_product_info")
+def always_product_info():
+    sql = """
+          SELECT pi.product_seq  AS product_seq, \
+                 pi.product_id   AS product_id, \
+                 pi.product_name AS product_name, \
+                 pc.category_seq AS category_seq, \
+                 c.category_name AS category_name, \
+                 pi.cost_price      cost_price, \
+                 CONCAT('https://thumb-ssl.grip.show', \
+                        (CASE \
+                             WHEN length(ppi.image_path) > 0 THEN ppi.image_path \
+                             ELSE pppi.image_path \
+                            END), \
+                        '?type=w&w=500' \
+                 )               AS image_path
+          FROM grip_db_realtime.product_info pi
+                   LEFT JOIN grip_db_realtime.product_preview_image ppi ON ppi.product_seq = pi.product_seq
+                   LEFT JOIN grip_db.product_preview_image pppi \
+                             ON (pppi.image_seq = 1 AND pppi.product_seq = pi.product_seq)
+                   LEFT JOIN grip_db.product_category pc ON pi.product_seq = pc.product_seq
+                   LEFT JOIN grip_db.category c ON c.category_seq = pc.category_seq
+          WHERE pi.flash = 'N'
+            AND pi.deleted = 'N'
+            AND pi.excluded = 'N'
+            AND pi.cost_price > 0
+            AND pi.created_at >= DATEADD(YEAR, -1, CURRENT_TIMESTAMP) \
+
+          """
+    df = run_query_df(get_conn(), sql)
+    return df
+
+
+@st.cache_data(ttl=86400)  # 24시간 = 60*60*24초
+@track_load("product_reviews")
+def product_reviews(seller_names: tuple) -> pd.DataFrame:
+    """판매자들의 최근 6개월 리뷰를 한 번의 쿼리로 조회. 리뷰 이미지는 리뷰별 URL 배열로 집계.
+
+    한 판매자만 조회할 때는 1-tuple 로 호출. 캐시 키가 같도록 호출 측에서 정렬된 tuple 을 넘긴다.
+    """
+    sql = f"""
+        WITH t1 AS (
+            SELECT 
+                m.user_seq AS seller_seq,
+                m.user_name AS seller_name,
+                pr.product_seq AS product_seq,
+                pi.product_id AS product_id,
+                pi.product_name AS product_name,
+                pi.flash AS flash,
+                pr.user_seq AS user_seq,
+                pr.review_seq AS review_seq,
+                pr.review AS review,
+                pr.ratio AS ratio,
+                pr.review_length AS review_length,
+                pr.created_at AS created_at_review,
+                pr.seller_comment AS seller_comment,
+                CONCAT('https://thumb-ssl.grip.show', ppi.image_path, '?type=w&w=150') AS image_path
+            FROM grip_db_realtime.member m 
+                LEFT JOIN grip_db.product_review pr ON m.user_seq = pr.seller_seq
+                LEFT JOIN grip_db_realtime.product_info pi ON pr.product_seq = pi.product_seq
+                LEFT JOIN grip_db_realtime.product_preview_image ppi ON ppi.product_seq = pi.product_seq
+            WHERE
+                m.user_name IN ({', '.join(['%s'] * len(seller_names))})
+                AND pr.created_at > CURRENT_TIMESTAMP - INTERVAL '6 MONTH'
+                AND pr.review_length > 0
+                AND pi.cost_price > 0
+            -- 상품 미리보기 이미지가 여러 장이면 리뷰가 중복되므로 리뷰당 1건만 남김
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY pr.review_seq ORDER BY ppi.image_seq) = 1
+        ),
+
+        -- 리뷰에 첨부된 포토후기 이미지 (같은 이미지가 중복 첨부된 경우 첫 번째만 남김)
+        t2_images AS (
+            SELECT
+                ai.relation_seq,
+                ai.image_path,
+                ai.created_at
+            FROM grip_db_realtime.attached_image ai
+            WHERE
+                ai.image_type = 14
+                AND LENGTH(ai.image_path) > 0
+                AND ai.relation_seq IN (SELECT review_seq FROM t1)
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY ai.relation_seq, ai.image_path ORDER BY ai.created_at) = 1
+        ),
+
+        -- 리뷰 단위로 첨부 순서대로 URL 배열로 집계
+        t2 AS (
+            SELECT
+                relation_seq,
+                ARRAY_AGG(CONCAT('https://thumb-ssl.grip.show', image_path, '?type=w&w=150'))
+                    WITHIN GROUP (ORDER BY created_at, image_path)
+                    AS review_image_paths
+            FROM t2_images
+            GROUP BY relation_seq
+        )
+
+        SELECT
+            t1.seller_seq,
+            t1.seller_name,
+            t1.product_seq,
+            t1.product_id,
+            t1.product_name,
+            t1.flash,
+            t1.user_seq,
+            m.user_name AS user_name,
+            t1.review_seq,
+            t1.review,
+            t1.ratio,
+            t1.review_length,
+            t1.created_at_review,
+            t1.seller_comment,
+            t1.image_path,
+            t2.review_image_paths
+
+        FROM t1
+            LEFT JOIN t2 ON t2.relation_seq = t1.review_seq
+            LEFT JOIN grip_db_realtime.member m ON m.user_seq = t1.user_seq
+        ORDER BY t1.seller_name, t1.review_length DESC
+    """
+    # 판매자 이름은 SQL 에 직접 넣지 않고 %s 자리에 바인딩
+    df = run_query_df(get_conn(), sql, seller_names)
+    return parse_review_image_paths(df)
+
+
+def parse_review_image_paths(df: pd.DataFrame) -> pd.DataFrame:
+    # ARRAY 컬럼은 JSON 문자열로 내려오고, 포토후기가 없는 리뷰는 NULL
+    df["REVIEW_IMAGE_PATHS"] = df["REVIEW_IMAGE_PATHS"].map(lambda v: json.loads(v) if v else [])
+    return df
+
+
+def build_product_df(flash_df, always_df) -> pd.DataFrame:
+    flash_sub_df = flash_df[[
+        "PRODUCT_NAME", "LV2_CATEGORY_NAME", "LV3_CATEGORY_NAME", "LV4_CATEGORY_NAME",
+        "PRODUCT_ID", "COST_PRICE"
+    ]]
+    flash_sub_df = flash_sub_df.rename(columns={"PRODUCT_NAME": "LLM_PRODUCT_NAME"})
+    flash_sub_df = flash_sub_df.fillna("").drop_duplicates(["PRODUCT_ID"])
+
+    always_sub_df = always_df.drop_duplicates(["PRODUCT_ID", "CATEGORY_SEQ"])
+    always_sub_df = always_sub_df.groupby("PRODUCT_ID")["CATEGORY_NAME"].apply(list).reset_index(
+        name="CATEGORY_LIST")
+
+    return pd.merge(always_sub_df, flash_sub_df, how="outer")
+
+
+def merge_reviews(review_df: pd.DataFrame, product_df: pd.DataFrame) -> pd.DataFrame:
+    review_sub_df = pd.merge(review_df, product_df, on="PRODUCT_ID", how="left")
+    return review_sub_df.fillna("")
+
+
+def group_by_category(review_sub_df: pd.DataFrame) -> dict:
+    review_category_dict = {}
+    for _, row in review_sub_df.iterrows():
+        CATEGORY_LIST = row["CATEGORY_LIST"]
+        PRODUCT_NAME = row["PRODUCT_NAME"]
+        LLM_PRODUCT_NAME = row["PRODUCT_NAME"]
+        LV2_CATEGORY_NAME = row["LV2_CATEGORY_NAME"]
+        LV3_CATEGORY_NAME = row["LV3_CATEGORY_NAME"]
+        LV4_CATEGORY_NAME = row["LV4_CATEGORY_NAME"]
+        COST_PRICE = row["COST_PRICE"]
+        IMAGE_PATH = row["IMAGE_PATH"]
+        REVIEW = row["REVIEW"]
+        RATIO = row["RATIO"]
+        USER_NAME = row["USER_NAME"]
+
+        if IMAGE_PATH:
+            pass
+        else:
+            continue
+
+        if CATEGORY_LIST:
+            for category in CATEGORY_LIST:
+                if category not in review_category_dict:
+                    review_category_dict[category] = []
+                review_category_dict[category].append({
+                    "PRODUCT_NAME": PRODUCT_NAME,
+                    "USER_NAME": USER_NAME,
+                    "REVIEW": REVIEW,
+                    "COST_PRICE": COST_PRICE,
+                    "RATIO": RATIO,
+                    "IMAGE_PATH": IMAGE_PATH,
+                    "상품": "상시상품"
+                })
+            continue
+        elif LV2_CATEGORY_NAME:
+            for category in [LV2_CATEGORY_NAME, LV3_CATEGORY_NAME, LV4_CATEGORY_NAME]:
+                if category:
+                    if category not in review_category_dict:
+                        review_category_dict[category] = []
+                    review_category_dict[category].append({
+                        "LLM_PRODUCT_NAME": LLM_PRODUCT_NAME,
+                        "USER_NAME": USER_NAME,
+                        "REVIEW": REVIEW,
+                        "COST_PRICE": COST_PRICE,
+                        "RATIO": RATIO,
+                        "IMAGE_PATH": IMAGE_PATH,
+                        "상품": "플래시상품"
+                    })
+
+    return review_category_dict
+
+
+def extract_photo_urls(review_sub_df: pd.DataFrame) -> list:
+    # 리뷰별 이미지 목록을 리뷰 순서(리뷰 길이 내림차순)대로 펼침
+    return [u for paths in review_sub_df["REVIEW_IMAGE_PATHS"] for u in paths]